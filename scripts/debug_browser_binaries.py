@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 import argparse
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, List
+import os
 import subprocess
 import sys
 
+SKIP_DIRS = frozenset({"locales", "swiftshader", "resources", "Crashpad"})
+MAX_DEPTH = 6
+
 
 @dataclass
 class BinaryInfo:
@@ -42,11 +47,25 @@ def expand_roots(root_arguments: Iterable[str]) -> List[Path]:
 
 
 def find_binary(roots: Iterable[Path], patterns: Iterable[str]) -> Path | None:
+    patterns = tuple(patterns)
+    basenames = frozenset(pattern for pattern in patterns if "/" not in pattern)
+    suffixes = tuple(os.sep + os.path.normpath(pattern) for pattern in patterns if "/" in pattern)
     for root in roots:
-        for pattern in patterns:
-            for candidate in root.rglob(pattern):
-                if candidate.is_file() or candidate.is_symlink():
-                    return candidate
+        pending = deque([(str(root), 0)])
+        while pending:
+            directory, depth = pending.popleft()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.name in SKIP_DIRS:
+                            continue
+                        if entry.is_file(follow_symlinks=False) or entry.is_symlink():
+                            if entry.name in basenames or entry.path.endswith(suffixes):
+                                return Path(entry.path)
+                        elif depth < MAX_DEPTH and entry.is_dir(follow_symlinks=False):
+                            pending.append((entry.path, depth + 1))
+            except OSError:
+                continue
     return None
 
 
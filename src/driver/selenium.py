@@ -1,36 +1,99 @@
 """Abstractions around Selenium browser automation used by the desktop app."""
 from __future__ import annotations
 
+import json
 import os
+import pickle
 import shutil
+from collections import deque
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
 
 import platform
 import subprocess
+import threading
 import time
+from urllib.parse import urlsplit
 
-from selenium import webdriver
 from selenium.common.exceptions import (
     NoSuchElementException,
     StaleElementReferenceException,
     TimeoutException,
     WebDriverException,
 )
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.alert import Alert
-from selenium.webdriver.common.by import By
-from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.remote.webelement import WebElement
+    from selenium.webdriver.support.ui import WebDriverWait
 
 from utils.filesystem import get_resource_path
 
 from . import logger
 
 
+@lru_cache(maxsize=None)
+def _selenium() -> SimpleNamespace:
+    """Import the ``selenium.webdriver`` names used by :class:`BrowserClient` on first use.
+
+    Importing ``selenium.webdriver`` pulls in every browser backend, so modules that
+    only need the dataclasses or binary discovery never pay for it.
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.common.alert import Alert
+    from selenium.webdriver.support import expected_conditions
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    return SimpleNamespace(
+        webdriver=webdriver,
+        Options=Options,
+        Service=Service,
+        Alert=Alert,
+        EC=expected_conditions,
+        WebDriverWait=WebDriverWait,
+    )
+
+
+# Portable Chromium trees contain thousands of resource files; the binaries never
+# live below these directories, so the search does not descend into them.
+_SEARCH_SKIP_DIRS = frozenset({"locales", "swiftshader", "resources", "Crashpad"})
+_SEARCH_MAX_DEPTH = 6
+
+_DEFAULT_CHROME_ARGUMENTS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-infobars",
+    "--window-size=1450,860",
+    "--password-store=basic",
+    "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/87.0.4280.66 Safari/537.36",
+)
+
+# Values of the selenium.webdriver.common.by.By constants.
+_CSS_SELECTOR = "css selector"
+_CAPTCHA_FRAME_SELECTOR = "iframe[src*='captcha']"
+_SELECTOR_MAP: Dict[str, str] = {
+    "css": _CSS_SELECTOR,
+    "xpath": "xpath",
+    "id": "id",
+    "name": "name",
+    "class": "class name",
+    "tag": "tag name",
+    "link": "link text",
+    "partial": "partial link text",
+}
+
+
 @dataclass(frozen=True)
 class BrowserBinaryPaths:
     """Represents the filesystem location of the packaged browser binaries."""
@@ -64,6 +127,126 @@ class BrowserEnvironment:
         return payload
 
 
+def _env_cache_path() -> Path:
+    if os.name == "nt":
+        base = Path(os.getenv("LOCALAPPDATA", Path.home()))
+        return base / "Copliot Enigma" / "browser_env.json"
+    return Path.home() / ".cache" / "copliot-enigma" / "browser_env.json"
+
+
+def _binary_fingerprint(paths: BrowserBinaryPaths) -> Optional[List[List[int]]]:
+    """Return the ``(mtime_ns, size)`` pairs identifying both binaries, if present."""
+    try:
+        stats = [os.stat(paths.browser_executable), os.stat(paths.driver_executable)]
+    except OSError:
+        return None
+    return [[stat.st_mtime_ns, stat.st_size] for stat in stats]
+
+
+def _is_packaged(paths: BrowserBinaryPaths, roots: List[Path]) -> bool:
+    """Return whether both binaries live below one of the packaged search ``roots``."""
+    return all(
+        any(Path(executable).is_relative_to(root) for root in roots)
+        for executable in (paths.browser_executable, paths.driver_executable)
+    )
+
+
+def _load_env_cache(
+    roots: List[Path], paths: Optional[BrowserBinaryPaths] = None
+) -> Optional[Dict[str, Any]]:
+    """Return the cached browser environment if it belongs to ``roots`` and is unchanged."""
+    try:
+        payload = json.loads(_env_cache_path().read_text(encoding="utf-8"))
+        cached_paths = BrowserBinaryPaths(
+            browser_executable=payload["browser_executable"],
+            driver_executable=payload["driver_executable"],
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    # A different install (or an upgrade elsewhere) must not reuse these binaries.
+    if payload.get("roots") != [str(root) for root in roots]:
+        return None
+    if paths is not None and cached_paths != paths:
+        return None
+    if payload.get("fingerprint") != _binary_fingerprint(cached_paths):
+        return None
+    return payload
+
+
+def _save_env_cache(
+    roots: List[Path],
+    paths: BrowserBinaryPaths,
+    browser_version: Optional[str] = None,
+    driver_version: Optional[str] = None,
+) -> None:
+    # System installs are only a fallback; caching them would hide packaged
+    # binaries that appear later.
+    if not _is_packaged(paths, roots):
+        return
+    fingerprint = _binary_fingerprint(paths)
+    if fingerprint is None:
+        return
+    payload: Dict[str, Any] = paths.to_dict()
+    payload["roots"] = [str(root) for root in roots]
+    payload["fingerprint"] = fingerprint
+    if browser_version is not None and driver_version is not None:
+        payload["browser_version"] = browser_version
+        payload["driver_version"] = driver_version
+    cache_path = _env_cache_path()
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(payload), encoding="utf-8")
+    except OSError as error:
+        logger.debug("Unable to write browser environment cache %s: %s", cache_path, error)
+
+
+def _compile_patterns(patterns: Iterable[str]) -> tuple[frozenset[str], tuple[str, ...]]:
+    """Split binary patterns into exact file names and path suffixes."""
+    basenames = frozenset(pattern for pattern in patterns if "/" not in pattern)
+    suffixes = tuple(
+        os.sep + os.path.normpath(pattern) for pattern in patterns if "/" in pattern
+    )
+    return basenames, suffixes
+
+
+def _probe_roots(roots: List[Path], candidates: Iterable[str]) -> Optional[Path]:
+    """Return the first ``root / candidate`` that is an existing file."""
+    for root in roots:
+        for candidate in candidates:
+            path = root / candidate
+            if os.path.isfile(path):
+                return path
+    return None
+
+
+def _scan_root(
+    root: Path, matchers: Dict[int, tuple[frozenset[str], tuple[str, ...]]]
+) -> Dict[int, Path]:
+    """Walk ``root`` breadth-first once, returning the first match for every matcher."""
+    found: Dict[int, Path] = {}
+    pending = deque([(str(root), 0)])
+    while pending:
+        directory, depth = pending.popleft()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name in _SEARCH_SKIP_DIRS:
+                        continue
+                    if entry.is_file(follow_symlinks=False) or entry.is_symlink():
+                        for key, (basenames, suffixes) in matchers.items():
+                            if key in found:
+                                continue
+                            if entry.name in basenames or entry.path.endswith(suffixes):
+                                found[key] = Path(entry.path)
+                        if len(found) == len(matchers):
+                            return found
+                    elif depth < _SEARCH_MAX_DEPTH and entry.is_dir(follow_symlinks=False):
+                        pending.append((entry.path, depth + 1))
+        except OSError:
+            continue
+    return found
+
+
 class UIElement:
     """Represents a declarative action against a UI element."""
 
@@ -73,6 +256,10 @@ class UIElement:
         self.selector_value: str = element_data.get("selector_value", "")
         self.action: str = element_data.get("action", "")
         self.post_action: str = element_data.get("post_action", "")
+        self.locator: tuple[str, str] = (
+            _SELECTOR_MAP.get(self.selector_type.lower(), _CSS_SELECTOR),
+            self.selector_value,
+        )
 
     def to_dict(self) -> Dict[str, str]:
         return {
@@ -96,6 +283,8 @@ class BrowserClient:
         wait_timeout: int = 10,
     ):
         self.driver: Optional[webdriver.Chrome] = None
+        # Guards driver start-up and shutdown, which may run on a worker thread.
+        self._driver_lock = threading.Lock()
         self.initial_window_handle: Optional[str] = None
         self.timeout_after = timeout_after
         self.max_retries = max_retries
@@ -105,60 +294,68 @@ class BrowserClient:
         self.last_request = None
         self.wait_timeout = wait_timeout
         self.wait: Optional[WebDriverWait] = None
+        self._wait_cache: Dict[tuple[float, float], WebDriverWait] = {}
         self._binary_paths: Optional[BrowserBinaryPaths] = None
+        # Packaged browser directories followed by the fallback root, resolved once.
+        self._root_paths: Optional[tuple[str, str, str]] = None
 
     # ------------------------------------------------------------------
     # Driver bootstrap
     # ------------------------------------------------------------------
     def ensure_driver(self) -> None:
         """Initialise the Chrome driver if it is not already running."""
-        if self.driver is None:
-            self.initialize_driver()
+        if self.driver is not None:
+            return
+        with self._driver_lock:
+            if self.driver is None:
+                self.initialize_driver()
 
     def initialize_driver(self) -> None:
+        webdriver = _selenium().webdriver
+
         options = self._configure_chrome_options()
         service = self._create_chrome_service(options)
 
+        # Configure a local driver and publish it last, so callers that check
+        # ``self.driver`` without the lock never see a half-initialised client.
+        driver: Optional[webdriver.Chrome] = None
         try:
             if service is not None:
-                self.driver = webdriver.Chrome(service=service, options=options)
+                driver = webdriver.Chrome(service=service, options=options)
             else:
-                self.driver = webdriver.Chrome(options=options)
-            self.wait = WebDriverWait(self.driver, self.wait_timeout)
-            self.driver.request_interceptor = self._intercept_request
-            self.request_interceptor = self._intercept_request
-            self.initial_window_handle = self.driver.current_window_handle
-            logger.debug(
-                f"Successfully initialised Chromium with window handle {self.initial_window_handle}"
-            )
+                driver = webdriver.Chrome(options=options)
+            driver.request_interceptor = self._intercept_request
+            initial_window_handle = driver.current_window_handle
         except WebDriverException as error:
-            logger.error(f"Failed to initialise Chrome browser: {error}")
+            logger.error("Failed to initialise Chrome browser: %s", error)
             logger.error(
                 "Ensure that the Chromium and ChromeDriver binaries are correctly bundled."
             )
+            if driver is not None:
+                try:
+                    driver.quit()
+                except WebDriverException as quit_error:
+                    logger.debug("Failed to quit partially started Chrome: %s", quit_error)
             raise
 
+        wait = _selenium().WebDriverWait(driver, self.wait_timeout, poll_frequency=0.5)
+        self._wait_cache = {(self.wait_timeout, 0.5): wait}
+        self.wait = wait
+        self.request_interceptor = self._intercept_request
+        self.initial_window_handle = initial_window_handle
+        self.driver = driver
+        logger.debug(
+            "Successfully initialised Chromium with window handle %s",
+            self.initial_window_handle,
+        )
+
     def _configure_chrome_options(self) -> Options:
-        options = Options()
+        options = _selenium().Options()
         if self.browser_headless:
             options.add_argument("--headless=new")
             logger.debug("Headless mode enabled")
 
-        default_arguments = [
-            "--no-sandbox",
-            "--disable-dev-shm-usage",
-            "--disable-gpu",
-            "--disable-extensions",
-            "--disable-blink-features=AutomationControlled",
-            "--disable-infobars",
-            "--window-size=1450,860",
-            "--password-store=basic",
-            "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/87.0.4280.66 Safari/537.36",
-        ]
-
-        for argument in default_arguments:
-            options.add_argument(argument)
+        options.arguments.extend(_DEFAULT_CHROME_ARGUMENTS)
 
         if self.is_experimental:
             experimental_options = {
@@ -173,7 +370,7 @@ class BrowserClient:
                 options.add_experimental_option(option_name, option_value)
             logger.debug("Experimental Chrome options applied")
 
-        logger.debug(f"Chrome configured with options: {options.arguments}")
+        logger.debug("Chrome configured with options: %s", options.arguments)
         return options
 
     def _create_chrome_service(self, options: Options) -> Optional[Service]:
@@ -186,7 +383,7 @@ class BrowserClient:
             browser_executable = self._discover_system_browser()
             if browser_executable:
                 options.binary_location = browser_executable
-                logger.debug(f"Using system Chromium binary at {browser_executable}")
+                logger.debug("Using system Chromium binary at %s", browser_executable)
             else:
                 logger.warning(
                     "No system Chromium binary detected. Selenium Manager will attempt to locate one."
@@ -194,19 +391,29 @@ class BrowserClient:
             return None
 
         options.binary_location = self._binary_paths.browser_executable
-        logger.debug(f"Using Chromium binary at {options.binary_location}")
-        logger.debug(
-            f"Using ChromeDriver binary at {self._binary_paths.driver_executable}"
-        )
-        return Service(executable_path=self._binary_paths.driver_executable)
+        logger.debug("Using Chromium binary at %s", options.binary_location)
+        logger.debug("Using ChromeDriver binary at %s", self._binary_paths.driver_executable)
+        return _selenium().Service(executable_path=self._binary_paths.driver_executable)
+
+    def _resolve_binary_paths(self, use_cache: bool = True) -> BrowserBinaryPaths:
+        search_roots = self._candidate_roots()
+        cached = _load_env_cache(search_roots) if use_cache else None
+        if cached is not None:
+            return BrowserBinaryPaths(
+                browser_executable=cached["browser_executable"],
+                driver_executable=cached["driver_executable"],
+            )
 
-    def _resolve_binary_paths(self) -> BrowserBinaryPaths:
         platform_name = platform.system().lower()
         driver_name = "chromedriver.exe" if platform_name.startswith("win") else "chromedriver"
 
+        # Layouts produced by the build workflows, probed before any directory walk.
+        driver_hints = [f"chromedriver/{driver_name}"]
+
         browser_candidates: Iterable[str]
         if platform_name.startswith("win"):
             browser_candidates = ["chrome.exe"]
+            driver_hints.append(f"chromedriver/chromedriver-win64/{driver_name}")
         elif platform_name == "darwin":
             browser_candidates = [
                 "Chromium.app/Contents/MacOS/Chromium",
@@ -215,9 +422,10 @@ class BrowserClient:
         else:
             browser_candidates = ["chrome", "chromium"]
 
-        search_roots = self._candidate_roots()
-        browser_path = self._find_binary(search_roots, browser_candidates)
-        driver_path = self._find_binary(search_roots, [driver_name])
+        browser_path, driver_path = self._find_binaries(
+            search_roots,
+            [(browser_candidates, ()), ([driver_name], driver_hints)],
+        )
 
         if browser_path is None or driver_path is None:
             fallback_paths = self._resolve_system_binary_paths()
@@ -230,10 +438,12 @@ class BrowserClient:
                 "Unable to locate packaged Chromium or ChromeDriver binaries."
             )
 
-        return BrowserBinaryPaths(
+        paths = BrowserBinaryPaths(
             browser_executable=str(browser_path),
             driver_executable=str(driver_path),
         )
+        _save_env_cache(search_roots, paths)
+        return paths
 
     def _resolve_system_binary_paths(self) -> Optional[BrowserBinaryPaths]:
         browser_executable = self._discover_system_browser()
@@ -247,28 +457,45 @@ class BrowserClient:
         return None
 
     def _candidate_roots(self) -> List[Path]:
-        potential_roots = [
-            Path(get_resource_path("chrome_portable")),
-            Path(get_resource_path("ungoogled_chromium")),
-        ]
-
-        roots: List[Path] = []
-        for root in potential_roots:
-            if root.exists():
-                roots.append(root)
+        if self._root_paths is None:
+            self._root_paths = (
+                get_resource_path("chrome_portable"),
+                get_resource_path("ungoogled_chromium"),
+                get_resource_path("."),
+            )
+        *packaged, fallback = self._root_paths
+        roots = [Path(root) for root in packaged if os.path.isdir(root)]
         if not roots:
-            roots.append(Path(get_resource_path(".")))
+            roots.append(Path(fallback))
         return roots
 
     @staticmethod
-    def _find_binary(roots: Iterable[Path], patterns: Iterable[str]) -> Optional[Path]:
-        for root in roots:
+    def _find_binaries(
+        roots: Iterable[Path],
+        searches: List[tuple[Iterable[str], Iterable[str]]],
+    ) -> List[Optional[Path]]:
+        """Locate several binaries, given as ``(patterns, hints)``, in one walk per root."""
+        roots = list(roots)
+        searches = [(tuple(patterns), tuple(hints)) for patterns, hints in searches]
+        results: List[Optional[Path]] = []
+        for patterns, hints in searches:
+            direct_candidates = list(hints)
             for pattern in patterns:
-                candidates = list(root.rglob(pattern))
-                for candidate in candidates:
-                    if candidate.is_file() or candidate.is_symlink():
-                        return candidate
-        return None
+                direct_candidates.extend((pattern, f"bin/{pattern}", os.path.basename(pattern)))
+            results.append(_probe_roots(roots, dict.fromkeys(direct_candidates)))
+
+        matchers = {
+            index: _compile_patterns(patterns)
+            for index, (patterns, _) in enumerate(searches)
+            if results[index] is None
+        }
+        for root in roots:
+            if not matchers:
+                break
+            for index, match in _scan_root(root, matchers).items():
+                results[index] = match
+                del matchers[index]
+        return results
 
     @staticmethod
     def _discover_system_browser() -> Optional[str]:
@@ -323,115 +550,164 @@ class BrowserClient:
         self.ensure_driver()
         if not self.driver:
             raise RuntimeError("Chrome driver is not initialised")
-        logger.info(f"Navigating to {url}")
+        logger.info("Navigating to %s", url)
         self.driver.get(url)
 
-    def describe_environment(self) -> BrowserEnvironment:
+    def describe_environment(self, refresh: bool = False) -> BrowserEnvironment:
+        """Describe the browser binaries in use and their versions.
+
+        By default paths and versions come from the fingerprint-checked disk cache
+        when it is valid; ``refresh`` searches for the binaries again and re-probes
+        their versions.
+        """
+        if refresh:
+            self._binary_paths = self._resolve_binary_paths(use_cache=False)
         paths = self._binary_paths or self._resolve_binary_paths()
-        browser_version = self._read_binary_version(Path(paths.browser_executable))
-        driver_version = self._read_binary_version(Path(paths.driver_executable))
+        roots = self._candidate_roots()
+        cached = None if refresh else _load_env_cache(roots, paths)
+        if cached is not None and "browser_version" in cached and "driver_version" in cached:
+            return BrowserEnvironment(
+                binary_paths=paths,
+                browser_version=cached["browser_version"],
+                driver_version=cached["driver_version"],
+            )
+
+        browser_version, driver_version = self._read_binary_versions(
+            [Path(paths.browser_executable), Path(paths.driver_executable)]
+        )
+        if "Unknown" not in (browser_version, driver_version):
+            _save_env_cache(roots, paths, browser_version, driver_version)
         return BrowserEnvironment(
             binary_paths=paths,
             browser_version=browser_version,
             driver_version=driver_version,
         )
 
-    def _read_binary_version(self, executable: Path) -> str:
-        version_commands = [
-            [str(executable), "--version"],
-            [str(executable), "--product-version"],
-        ]
-        for command in version_commands:
-            try:
-                result = subprocess.run(
-                    command,
-                    capture_output=True,
-                    check=True,
-                    text=True,
-                )
-                output = (result.stdout or result.stderr).strip()
+    def _read_binary_versions(self, executables: List[Path]) -> List[str]:
+        """Probe every executable for its version, running the probes concurrently."""
+        versions = ["Unknown"] * len(executables)
+        pending = list(enumerate(executables))
+        for flag in ("--version", "--product-version"):
+            processes = []
+            for index, executable in pending:
+                try:
+                    process = subprocess.Popen(
+                        [str(executable), flag],
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                        text=True,
+                    )
+                except (FileNotFoundError, PermissionError):
+                    continue
+                processes.append((index, executable, process))
+
+            pending = []
+            for index, executable, process in processes:
+                # The version is the first line on stdout; do not wait for slow exits.
+                output = process.stdout.readline().strip()
+                process.stdout.close()
+                if process.poll() is None:
+                    process.kill()
+                elif process.returncode != 0:
+                    output = ""
+                process.wait(timeout=1)
                 if output:
-                    return output
-            except (subprocess.CalledProcessError, FileNotFoundError, PermissionError):
-                continue
-        return "Unknown"
+                    versions[index] = output
+                else:
+                    pending.append((index, executable))
+            if not pending:
+                break
+        return versions
 
     # ------------------------------------------------------------------
     # Element helpers
     # ------------------------------------------------------------------
+    def _get_wait(self, timeout: float, poll_frequency: float = 0.5) -> WebDriverWait:
+        """Return a cached ``WebDriverWait`` for the current driver."""
+        key = (timeout, poll_frequency)
+        wait = self._wait_cache.get(key)
+        if wait is None:
+            wait = _selenium().WebDriverWait(self.driver, timeout, poll_frequency=poll_frequency)
+            self._wait_cache[key] = wait
+        return wait
+
     @staticmethod
-    def _get_by_selector(selector: str) -> By:
-        selector_map = {
-            "css": By.CSS_SELECTOR,
-            "xpath": By.XPATH,
-            "id": By.ID,
-            "name": By.NAME,
-            "class": By.CLASS_NAME,
-            "tag": By.TAG_NAME,
-            "link": By.LINK_TEXT,
-            "partial": By.PARTIAL_LINK_TEXT,
-        }
-        return selector_map.get(selector.lower(), By.CSS_SELECTOR)
+    def _get_by_selector(selector: str) -> str:
+        return _SELECTOR_MAP.get(selector) or _SELECTOR_MAP.get(selector.lower(), _CSS_SELECTOR)
 
     def process_elements_chain(self, elements: List[UIElement]) -> None:
-        logger.debug(f"Processing {len(elements)} UI elements")
+        logger.debug("Processing %d UI elements", len(elements))
         for element in elements:
             self.process_element(element, self.max_retries)
 
     def process_element(self, element: UIElement, retries: int) -> None:
-        logger.debug(f"Processing element: {element.to_dict()}")
-        try:
-            found_element = self.wait_for_element(
-                selector_value=element.selector_value,
-                selector_type=element.selector_type,
-            )
-            if found_element is None:
-                raise NoSuchElementException(element.selector_value)
-            found_element = self.scroll_to_element(found_element)
-            found_element = self._perform_action(element, found_element)
-            if element.post_action:
-                self._perform_post_action(element, found_element)
-            time.sleep(1)
-            logger.debug(f"Successfully processed UI element {element.element_type}")
-        except (TimeoutException, NoSuchElementException, StaleElementReferenceException) as error:
-            if retries > 0:
-                logger.warning(
-                    (
-                        f"Error interacting with UI element '{element.element_type}': {error}. "
-                        f"Retrying {retries} more times."
-                    )
-                )
-                self.process_element(element, retries - 1)
-            else:
-                logger.error(
-                    (
-                        f"Failed to process UI element '{element.element_type}' after multiple "
-                        f"retries: {error}"
+        logger.debug("Processing element: %s", element.to_dict())
+        for remaining in range(retries, -1, -1):
+            try:
+                found_element = self.wait_for_element_by_locator(element.locator)
+                if found_element is None:
+                    raise NoSuchElementException(element.selector_value)
+                found_element = self._perform_action(element, found_element)
+                if element.post_action:
+                    self._perform_post_action(element, found_element)
+                logger.debug("Successfully processed UI element %s", element.element_type)
+                return
+            except (
+                TimeoutException,
+                NoSuchElementException,
+                StaleElementReferenceException,
+            ) as error:
+                if remaining == 0:
+                    logger.error(
+                        "Failed to process UI element '%s' after multiple retries: %s",
+                        element.element_type,
+                        error,
                     )
+                    return
+                logger.warning(
+                    "Error interacting with UI element '%s': %s. Retrying %d more times.",
+                    element.element_type,
+                    error,
+                    remaining,
                 )
-        except Exception as error:  # pylint: disable=broad-except
-            logger.error(f"Failed to process UI element '{element.element_type}': {error}")
+            except Exception as error:  # pylint: disable=broad-except
+                logger.error("Failed to process UI element '%s': %s", element.element_type, error)
+                return
 
     def _perform_action(self, element: UIElement, found_element: WebElement) -> WebElement:
         logger.debug(
-            f"Performing action={element.action} on element selector={element.selector_value}"
+            "Performing action=%s on element selector=%s",
+            element.action,
+            element.selector_value,
         )
-        if element.action == "click":
-            found_element.click()
-        elif element.action == "USE_SCRIPT":
-            self.driver.execute_script("arguments[0].click();", found_element)
-        elif element.action == "text":
-            found_element.text
-        logger.debug(f"Action {element.action} completed")
+        # A native click already scrolls the element into view and the script
+        # action scrolls inline, so only the remaining actions need a separate
+        # scroll round-trip.
+        match element.action:
+            case "click":
+                found_element.click()
+            case "USE_SCRIPT":
+                self.driver.execute_script(
+                    "arguments[0].scrollIntoView(); arguments[0].click();", found_element
+                )
+            case "text":
+                found_element = self.scroll_to_element(found_element)
+                found_element.text
+            case _:
+                found_element = self.scroll_to_element(found_element)
+        logger.debug("Action %s completed", element.action)
         return found_element
 
     def _perform_post_action(self, element: UIElement, found_element: WebElement) -> WebElement:
         logger.debug(
-            f"Performing post-action={element.post_action} on element selector={element.selector_value}"
+            "Performing post-action=%s on element selector=%s",
+            element.post_action,
+            element.selector_value,
         )
-        if element.post_action == "submit":
-            found_element.submit()
-        logger.debug(f"Post action {element.post_action} completed")
+        match element.post_action:
+            case "submit":
+                found_element.submit()
+        logger.debug("Post action %s completed", element.post_action)
         return found_element
 
     def wait_for_element(
@@ -439,20 +715,25 @@ class BrowserClient:
         selector_value: str,
         selector_type: str,
         timeout: Optional[int] = None,
+    ) -> Optional[WebElement]:
+        locator = (self._get_by_selector(selector_type), selector_value)
+        return self.wait_for_element_by_locator(locator, timeout)
+
+    def wait_for_element_by_locator(
+        self,
+        locator: tuple[str, str],
+        timeout: Optional[int] = None,
     ) -> Optional[WebElement]:
         self.ensure_driver()
         if not self.driver:
             return None
         wait_timeout = timeout or self.wait_timeout
-        locator = (self._get_by_selector(selector_type), selector_value)
         try:
-            return WebDriverWait(self.driver, wait_timeout).until(
-                EC.presence_of_element_located(locator)
+            return self._get_wait(wait_timeout).until(
+                _selenium().EC.presence_of_element_located(locator)
             )
         except TimeoutException:
-            logger.debug(
-                f"Element {selector_value} not found within {wait_timeout} seconds"
-            )
+            logger.debug("Element %s not found within %s seconds", locator[1], wait_timeout)
             return None
 
     def click_element(self, selector_type: str, selector_value: str) -> None:
@@ -460,14 +741,14 @@ class BrowserClient:
         if element:
             element.click()
         else:
-            logger.warning(f"Element {selector_value} not found for clicking")
+            logger.warning("Element %s not found for clicking", selector_value)
 
     def send_keys_to_element(self, selector_type: str, selector_value: str, keys: str) -> None:
         element = self.wait_for_element(selector_value, selector_type)
         if element:
             element.send_keys(keys)
         else:
-            logger.warning(f"Element {selector_value} not found for sending keys")
+            logger.warning("Element %s not found for sending keys", selector_value)
 
     def wait_for_clickable_element(
         self, selector_type: str, selector_value: str, timeout: Optional[int] = None
@@ -478,32 +759,35 @@ class BrowserClient:
         wait_timeout = timeout or self.wait_timeout
         locator = (self._get_by_selector(selector_type), selector_value)
         try:
-            return WebDriverWait(self.driver, wait_timeout).until(
-                EC.element_to_be_clickable(locator)
+            return self._get_wait(wait_timeout).until(
+                _selenium().EC.element_to_be_clickable(locator)
             )
         except TimeoutException:
             logger.debug(
-                f"Element {selector_value} not clickable within {wait_timeout} seconds"
+                "Element %s not clickable within %s seconds", selector_value, wait_timeout
             )
             return None
 
     def handle_shadow_dom(self, host_selector: str, shadow_element_selector: str) -> Optional[WebElement]:
         shadow_host = self.wait_for_element(host_selector, "css")
         if not shadow_host or not self.driver:
-            logger.warning(f"Shadow host {host_selector} not found")
+            logger.warning("Shadow host %s not found", host_selector)
             return None
         shadow_root = self.driver.execute_script("return arguments[0].shadowRoot", shadow_host)
-        return shadow_root.find_element(By.CSS_SELECTOR, shadow_element_selector)
+        return shadow_root.find_element(_CSS_SELECTOR, shadow_element_selector)
 
     def handle_captcha(self) -> None:
         if not self.driver:
             return
         try:
-            captcha_frame = self.driver.find_element(By.CSS_SELECTOR, "iframe[src*='captcha']")
+            captcha_frame = self.driver.find_element(_CSS_SELECTOR, _CAPTCHA_FRAME_SELECTOR)
             if captcha_frame:
                 logger.info("CAPTCHA detected. Waiting for manual resolution.")
-                while "captcha" in self.driver.page_source:
-                    time.sleep(5)
+                # Ask the page for a boolean instead of downloading the whole DOM per poll.
+                while self.driver.execute_script(
+                    "return !!document.querySelector(arguments[0]);", _CAPTCHA_FRAME_SELECTOR
+                ):
+                    time.sleep(0.5)
                 logger.info("CAPTCHA solved")
         except NoSuchElementException:
             logger.debug("No CAPTCHA detected")
@@ -511,10 +795,11 @@ class BrowserClient:
     def handle_alert(self) -> None:
         if not self.driver:
             return
+        selenium = _selenium()
         try:
-            WebDriverWait(self.driver, 5).until(EC.alert_is_present())
-            alert = Alert(self.driver)
-            logger.info(f"Alert detected: {alert.text}")
+            self._get_wait(5).until(selenium.EC.alert_is_present())
+            alert = selenium.Alert(self.driver)
+            logger.info("Alert detected: %s", alert.text)
             alert.accept()
         except TimeoutException:
             logger.debug("No alert present")
@@ -522,32 +807,40 @@ class BrowserClient:
     def save_cookies(self) -> None:
         if not self.driver:
             return
-        import pickle
-
         base_url = self.get_base_url().replace(".", "_")
-        path = f"cookies_{base_url}.pkl"
-        with open(path, "wb") as file_pointer:
-            pickle.dump(self.driver.get_cookies(), file_pointer)
+        path = f"cookies_{base_url}.json"
+        with open(path, "w", encoding="utf-8") as file_pointer:
+            json.dump(self.driver.get_cookies(), file_pointer)
 
     def load_cookies(self) -> None:
         if not self.driver:
             return
-        import pickle
-
         base_url = self.get_base_url().replace(".", "_")
-        path = f"cookies_{base_url}.pkl"
+        path = f"cookies_{base_url}.json"
+        try:
+            with open(path, "r", encoding="utf-8") as file_pointer:
+                cookies = json.load(file_pointer)
+        except FileNotFoundError:
+            cookies = self._load_legacy_cookies(f"cookies_{base_url}.pkl")
+            if cookies is None:
+                logger.warning("Cookie file %s not found", path)
+                return
+        for cookie in cookies:
+            self.driver.add_cookie(cookie)
+
+    @staticmethod
+    def _load_legacy_cookies(path: str) -> Optional[List[Dict[str, Any]]]:
+        """Read cookies written by releases that stored them with pickle."""
         try:
             with open(path, "rb") as file_pointer:
-                cookies = pickle.load(file_pointer)
-                for cookie in cookies:
-                    self.driver.add_cookie(cookie)
+                return pickle.load(file_pointer)
         except FileNotFoundError:
-            logger.warning(f"Cookie file {path} not found")
+            return None
 
     def get_base_url(self) -> str:
         if not self.driver:
             return ""
-        return self.driver.current_url.split("/")[2]
+        return urlsplit(self.driver.current_url).netloc
 
     def scroll_to_element(self, element: WebElement) -> WebElement:
         if self.driver:
@@ -562,30 +855,33 @@ class BrowserClient:
     def wait_for_ajax(self, timeout: int = 10) -> None:
         if not self.driver:
             return
-        end_time = time.time() + timeout
-        while time.time() < end_time:
-            pending = self.driver.execute_script("return window.jQuery ? jQuery.active : 0")
-            if not pending:
-                return
-            time.sleep(0.5)
-        logger.warning(f"AJAX requests did not complete within {timeout} seconds")
+        try:
+            self._get_wait(timeout, poll_frequency=0.1).until(
+                lambda driver: not driver.execute_script(
+                    "return window.jQuery ? jQuery.active : 0"
+                )
+            )
+        except TimeoutException:
+            logger.warning("AJAX requests did not complete within %s seconds", timeout)
 
     def close_driver(self) -> None:
-        if self.driver:
-            self.driver.quit()
-            self.driver = None
-            self.wait = None
-            self.initial_window_handle = None
-            logger.info("Chrome browser closed successfully")
-        else:
-            logger.warning("Driver is not initialised")
+        with self._driver_lock:
+            if self.driver:
+                self.driver.quit()
+                self.driver = None
+                self.wait = None
+                self._wait_cache.clear()
+                self.initial_window_handle = None
+                logger.info("Chrome browser closed successfully")
+            else:
+                logger.warning("Driver is not initialised")
 
     # ------------------------------------------------------------------
     # Request interception helpers
     # ------------------------------------------------------------------
     def _intercept_request(self, request):
         self.last_request = request
-        logger.debug(f"Intercepted request: {request.method} {request.url}")
+        logger.debug("Intercepted request: %s %s", request.method, request.url)
 
     def get_last_request(self):
         return self.last_request
@@ -595,13 +891,17 @@ class BrowserClient:
         element = self.wait_for_clickable_element(by, value)
         if element:
             element.click()
-        timeout = 10
-        while self.last_request is None and timeout > 0:
-            timeout -= 1
-            time.sleep(1)
+            try:
+                self._get_wait(10, poll_frequency=0.05).until(
+                    lambda _: self.last_request is not None
+                )
+            except TimeoutException:
+                pass
         if self.last_request:
             logger.debug(
-                f"Next request after action: {self.last_request.method} {self.last_request.url}"
+                "Next request after action: %s %s",
+                self.last_request.method,
+                self.last_request.url,
             )
         else:
             logger.warning("No request intercepted after the action")
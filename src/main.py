@@ -1,31 +1,49 @@
 """Entry point for the ScrapeGoat desktop application."""
 from __future__ import annotations
 
+import re
+import threading
 import tkinter as tk
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import List
+from typing import Dict, List
 from urllib.parse import urlparse, urlunparse
 
 import ttkbootstrap as ttk
+from tkinter import font as tkfont
 from tkinter import messagebox
 
 from driver.selenium import BrowserClient
 from utils.diagnostics import DiagnosticsService
 from utils.logger import Logger
 
+# Already well-formed http(s) URLs, which _normalise_url can return untouched.
+_URL_OK = re.compile(r"^https?://[^\s/$.?#][^\s]*$", re.IGNORECASE)
 
-@dataclass
+# Named Tk fonts shared by every heading label, created once by ScrapeGoatApp.
+TITLE_FONT = "ScrapeGoatTitleFont"
+SECTION_FONT = "ScrapeGoatSectionFont"
+
+
+@dataclass(slots=True)
 class ActivityHistory:
     """Keeps the browsing history displayed in the activity screen."""
 
-    items: List[str] = field(default_factory=list)
     max_items: int = 10
+    _items: "OrderedDict[str, None]" = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+
+    @property
+    def items(self) -> List[str]:
+        """Visited URLs, most recent first."""
+        return list(self._items)
 
     def add(self, url: str) -> None:
-        if url in self.items:
-            self.items.remove(url)
-        self.items.insert(0, url)
-        del self.items[self.max_items :]
+        self._items[url] = None
+        self._items.move_to_end(url, last=False)
+        while len(self._items) > self.max_items:
+            self._items.popitem(last=True)
 
 
 class ScrapeGoatApp:
@@ -40,6 +58,7 @@ class ScrapeGoatApp:
         self.root.title("ScrapeGoat Browser")
         self.root.geometry("1260x915")
         self.root.resizable(False, False)
+        self._fonts = self._create_fonts()
 
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(expand=True, fill="both", padx=10, pady=10)
@@ -61,20 +80,44 @@ class ScrapeGoatApp:
         self.root.protocol("WM_DELETE_WINDOW", self._shutdown)
         self.root.after(0, self._initialise_browser)
 
+    def _create_fonts(self) -> List[tkfont.Font]:
+        family = tkfont.nametofont("TkDefaultFont").actual("family")
+        return [
+            tkfont.Font(root=self.root, name=TITLE_FONT, family=family, size=12, weight="bold"),
+            tkfont.Font(root=self.root, name=SECTION_FONT, family=family, size=11, weight="bold"),
+        ]
+
     def _initialise_browser(self) -> None:
+        # Starting Chromium takes seconds; keep the event loop responsive meanwhile.
+        threading.Thread(target=self._bootstrap_worker, daemon=True).start()
+
+    def _bootstrap_worker(self) -> None:
+        """Start the browser off the Tk thread and hand the outcome back via ``after``."""
         try:
             self.browser_client.ensure_driver()
-            self.settings_screen.refresh()
         except Exception as error:  # pylint: disable=broad-except
-            self.logger.error(f"Failed to initialise browser: {error}")
-            messagebox.showerror(
-                "Initialisation error",
-                "The embedded browser could not be initialised. Please check the logs.",
-            )
+            self._post_to_ui(self._on_browser_error, error)
+            return
+        self._post_to_ui(self.settings_screen.refresh)
+
+    def _post_to_ui(self, callback, *args) -> None:
+        try:
+            self.root.after(0, callback, *args)
+        except (RuntimeError, tk.TclError):
+            # The window was closed while the browser was starting.
+            pass
+
+    def _on_browser_error(self, error: Exception) -> None:
+        self.logger.error(f"Failed to initialise browser: {error}")
+        messagebox.showerror(
+            "Initialisation error",
+            "The embedded browser could not be initialised. Please check the logs.",
+        )
 
     def _shutdown(self) -> None:
         self.browser_client.close_driver()
         self.root.destroy()
+        self.logger.shutdown()
 
     def run(self) -> None:
         self.root.mainloop()
@@ -97,7 +140,7 @@ class ActivityScreen(ttk.Frame):
         self._build_ui()
 
     def _build_ui(self) -> None:
-        ttk.Label(self, text="Open a web page", font=("TkDefaultFont", 12, "bold")).pack(
+        ttk.Label(self, text="Open a web page", font=TITLE_FONT).pack(
             anchor="w", padx=10, pady=(10, 5)
         )
 
@@ -119,7 +162,7 @@ class ActivityScreen(ttk.Frame):
 
         ttk.Separator(self, orient="horizontal").pack(fill="x", padx=10, pady=15)
 
-        ttk.Label(self, text="Recent activity", font=("TkDefaultFont", 11, "bold")).pack(
+        ttk.Label(self, text="Recent activity", font=SECTION_FONT).pack(
             anchor="w", padx=10
         )
 
@@ -176,6 +219,8 @@ class ActivityScreen(ttk.Frame):
 
     @staticmethod
     def _normalise_url(url: str) -> str:
+        if _URL_OK.match(url):
+            return url
         parsed = urlparse(url if "://" in url else f"https://{url}")
         if not parsed.netloc:
             raise ValueError("The provided text is not a valid URL.")
@@ -189,6 +234,8 @@ class SettingsScreen(ttk.Frame):
         super().__init__(master)
         self._diagnostics_service = diagnostics_service
         self.logger = logger
+        # Rows currently shown per tree, so refreshes only touch what changed.
+        self._rendered_rows: Dict[str, List[tuple[str, str]]] = {}
 
         self.system_tree = ttk.Treeview(self, columns=("Property", "Value"), show="headings", height=6)
         self.system_tree.heading("Property", text="Property")
@@ -205,23 +252,35 @@ class SettingsScreen(ttk.Frame):
         self._build_ui()
 
     def _build_ui(self) -> None:
-        ttk.Label(self, text="Diagnostics", font=("TkDefaultFont", 12, "bold")).pack(
+        ttk.Label(self, text="Diagnostics", font=TITLE_FONT).pack(
             anchor="w", padx=10, pady=(10, 5)
         )
         self.system_tree.pack(fill="x", padx=10)
 
-        ttk.Label(self, text="Capacity Estimates", font=("TkDefaultFont", 11, "bold")).pack(
+        ttk.Label(self, text="Capacity Estimates", font=SECTION_FONT).pack(
             anchor="w", padx=10, pady=(15, 5)
         )
         self.capacity_tree.pack(fill="x", padx=10)
 
-        ttk.Button(self, text="Refresh diagnostics", command=self.refresh).pack(
-            anchor="e", padx=10, pady=15
+        # "Refresh" may reuse a report from the last few seconds; "Re-scan" samples
+        # system metrics and memory again, re-locates the browser binaries and
+        # re-probes their versions instead of using the on-disk cache.
+        button_frame = ttk.Frame(self)
+        button_frame.pack(anchor="e", padx=10, pady=15)
+        ttk.Button(button_frame, text="Re-scan system", command=self._force_refresh).pack(
+            side="left", padx=(0, 5)
         )
+        ttk.Button(button_frame, text="Refresh diagnostics", command=self.refresh).pack(side="left")
 
         self.binary_info = tk.Text(self, height=6, state="disabled", wrap="word")
         self.binary_info.pack(fill="both", expand=True, padx=10, pady=(0, 10))
 
+    def _force_refresh(self) -> None:
+        self._diagnostics_service.invalidate()
+        self._diagnostics_service.invalidate_environment()
+        self._diagnostics_service.invalidate_memory_estimate()
+        self.refresh()
+
     def refresh(self) -> None:
         try:
             report = self._diagnostics_service.collect()
@@ -235,16 +294,27 @@ class SettingsScreen(ttk.Frame):
         self._populate_binary_info(report)
 
     def _populate_tree(self, tree: ttk.Treeview, rows: List[tuple[str, str]]) -> None:
-        for item in tree.get_children():
-            tree.delete(item)
-        for key, value in rows:
-            tree.insert("", "end", values=(key, value))
+        previous = self._rendered_rows.get(str(tree))
+        if rows == previous:
+            return
+
+        children = tree.get_children()
+        if previous is not None and len(previous) == len(rows) == len(children):
+            for iid, old_row, new_row in zip(children, previous, rows):
+                if old_row != new_row:
+                    tree.item(iid, values=new_row)
+        else:
+            tree.delete(*children)
+            insert = tree.insert
+            for row in rows:
+                insert("", "end", values=row)
+        self._rendered_rows[str(tree)] = rows
 
     def _populate_binary_info(self, report) -> None:
         self.binary_info.configure(state="normal")
         self.binary_info.delete("1.0", tk.END)
-        for key, value in report.binary_rows():
-            self.binary_info.insert(tk.END, f"{key}: {value}\n")
+        text = "".join(f"{key}: {value}\n" for key, value in report.binary_rows())
+        self.binary_info.insert("1.0", text)
         self.binary_info.configure(state="disabled")
 
 
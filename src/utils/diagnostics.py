@@ -1,14 +1,20 @@
 """Diagnostics helpers for the desktop application."""
 from __future__ import annotations
 
+import time
 from dataclasses import asdict, dataclass
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
-from driver.selenium import BrowserClient
-from utils.helpers import BrowserCapacity, calculate_max_browsers_or_tabs
+from driver.selenium import BrowserClient, BrowserEnvironment
+from utils.helpers import (
+    BrowserCapacity,
+    calculate_max_browsers_or_tabs,
+    clear_system_info_cache,
+    get_browser_memory_usage,
+)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BinaryDiagnostic:
     """Represents information about a packaged browser binary."""
 
@@ -20,7 +26,7 @@ class BinaryDiagnostic:
         return asdict(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiagnosticsReport:
     """Aggregated diagnostic data for the settings screen."""
 
@@ -53,14 +59,43 @@ class DiagnosticsReport:
 class DiagnosticsService:
     """Collects diagnostics information to feed the UI."""
 
-    def __init__(self, client: BrowserClient):
+    def __init__(self, client: BrowserClient, ttl: float = 5.0):
         self._client = client
+        self._ttl = ttl
+        self._cache: Optional[Tuple[float, DiagnosticsReport]] = None
+        self._environment: Optional[BrowserEnvironment] = None
+        self._refresh_environment = False
+
+    def invalidate(self) -> None:
+        """Drop the cached report and system metrics so the next ``collect`` gathers fresh data."""
+        self._cache = None
+        clear_system_info_cache()
+
+    def invalidate_environment(self) -> None:
+        """Forget the probed browser binaries so the next report re-reads them.
+
+        The next report also bypasses the on-disk environment cache, searching for
+        the binaries and probing their versions again.
+        """
+        self._environment = None
+        self._refresh_environment = True
+
+    def invalidate_memory_estimate(self) -> None:
+        """Discard the memoised per-browser memory sample so the next report re-measures it."""
+        get_browser_memory_usage.cache_clear()
 
     def collect(self) -> DiagnosticsReport:
+        if self._cache and time.monotonic() - self._cache[0] < self._ttl:
+            return self._cache[1]
+
         capacity = calculate_max_browsers_or_tabs()
         binaries: List[BinaryDiagnostic] = []
         try:
-            environment = self._client.describe_environment()
+            refresh, self._refresh_environment = self._refresh_environment, False
+            environment = self._environment or self._client.describe_environment(refresh=refresh)
+            # Keep failed version probes out of the memo so a later refresh can recover.
+            if "Unknown" not in (environment.browser_version, environment.driver_version):
+                self._environment = environment
             binaries.append(
                 BinaryDiagnostic(
                     name="Ungoogled Chromium",
@@ -90,4 +125,6 @@ class DiagnosticsService:
                     version=str(error),
                 )
             )
-        return DiagnosticsReport(capacity=capacity, binaries=binaries)
+        report = DiagnosticsReport(capacity=capacity, binaries=binaries)
+        self._cache = (time.monotonic(), report)
+        return report
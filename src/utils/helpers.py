@@ -1,21 +1,53 @@
 """Utility helpers for system diagnostics and URL handling."""
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
-from typing import Dict, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
+import asyncio
+import atexit
+import os
 import platform
-import re
-import subprocess
+import sys
 import time
-import urllib.parse
 
 import psutil
 
 DEFAULT_MEMORY_USAGE_MB = 350.0
-
-
-@dataclass(frozen=True)
+SYSTEM_INFO_TTL_SECONDS = 5.0
+
+# Command used to launch each supported browser and the process name to measure.
+_BROWSER_COMMANDS: Dict[str, Tuple[Tuple[str, ...], str]] = {
+    "chrome": (("google-chrome", "--headless", "--disable-gpu"), "chrome"),
+    "firefox": (("firefox", "--headless"), "firefox"),
+}
+
+# Browser RSS is sampled until it settles instead of after a fixed delay.
+_RSS_POLL_INTERVAL_SECONDS = 0.2
+_RSS_POLL_MAX_SAMPLES = 50
+_RSS_STABLE_RATIO = 0.02
+_RSS_STABLE_SAMPLES = 2
+# Give up once this many samples found no matching process at all.
+_RSS_EMPTY_SAMPLES = 5
+
+_CACHE_PREFIX = "https://webcache.googleusercontent.com/search?q=cache:"
+
+_BYTES_TO_MIB = 1.0 / (1024 * 1024)
+_BYTES_TO_GIB = 1.0 / (1024 * 1024 * 1024)
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+# Layout of "DD Mon YYYY HH:MM:SS", the 20 characters preceding " GMT".
+_SNAPSHOT_DATE_LENGTH = 20
+_SNAPSHOT_DIGIT_OFFSETS = (0, 1, 7, 8, 9, 10, 12, 13, 15, 16, 18, 19)
+_SNAPSHOT_SEPARATORS = ((2, " "), (6, " "), (11, " "), (14, ":"), (17, ":"))
+_MONTHS = frozenset(
+    {"Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"}
+)
+_DIGITS = frozenset("0123456789")
+
+
+@dataclass(frozen=True, slots=True)
 class SystemInfo:
     """Represents relevant system metrics for capacity calculations."""
 
@@ -28,10 +60,18 @@ class SystemInfo:
     os_version: str
 
     def to_dict(self) -> Dict[str, float | str | int]:
-        return asdict(self)
-
-
-@dataclass(frozen=True)
+        return {
+            "architecture": self.architecture,
+            "num_cores": self.num_cores,
+            "available_ram_gb": self.available_ram_gb,
+            "total_ram_gb": self.total_ram_gb,
+            "cpu_usage_percent": self.cpu_usage_percent,
+            "os": self.os,
+            "os_version": self.os_version,
+        }
+
+
+@dataclass(frozen=True, slots=True)
 class BrowserCapacity:
     """Describes how many browser instances the system can sustain."""
 
@@ -42,32 +82,79 @@ class BrowserCapacity:
     avg_memory_per_browser_mb: float
 
     def to_dict(self) -> Dict[str, object]:
-        payload = asdict(self)
-        payload["system_info"] = self.system_info.to_dict()
-        return payload
+        return {
+            "max_browsers_by_ram": self.max_browsers_by_ram,
+            "max_browsers_by_cpu": self.max_browsers_by_cpu,
+            "max_browsers": self.max_browsers,
+            "system_info": self.system_info.to_dict(),
+            "avg_memory_per_browser_mb": self.avg_memory_per_browser_mb,
+        }
 
 
-def get_system_info() -> SystemInfo:
-    """Gather key system information such as architecture, CPU cores, and RAM."""
+def _resolve_os() -> Tuple[str, str]:
+    if _OS_NAME == "windows":
+        return "Windows", platform.version()
+    if _OS_NAME == "darwin":
+        return "macOS", platform.mac_ver()[0]
+    if _OS_NAME == "linux":
+        return "Linux", platform.release()
+    return "Unknown", "Unknown"
+
 
-    os_name = platform.system().lower()
-    os_mapping = {
-        "windows": ("Windows", platform.version()),
-        "darwin": ("macOS", platform.mac_ver()[0]),
-        "linux": ("Linux", platform.release()),
-    }
-    resolved_os, resolved_version = os_mapping.get(os_name, ("Unknown", "Unknown"))
+# Platform details are fixed for the lifetime of the process.
+_OS_NAME = platform.system().lower()
+_ARCHITECTURE = platform.machine()
+_OS, _OS_VERSION = _resolve_os()
 
+_system_info_cache: Optional[Tuple[float, SystemInfo]] = None
+_devnull_fd: Optional[int] = None
+
+# Prime psutil's CPU counters so later non-blocking samples measure the
+# interval since import rather than returning a meaningless value.
+psutil.cpu_percent(interval=None)
+
+
+def _collect_system_info(cpu_interval: Optional[float]) -> SystemInfo:
+    global _system_info_cache
     memory = psutil.virtual_memory()
-    return SystemInfo(
-        architecture=platform.machine(),
+    info = SystemInfo(
+        architecture=_ARCHITECTURE,
         num_cores=psutil.cpu_count(logical=True) or 1,
-        available_ram_gb=memory.available / (1024 ** 3),
-        total_ram_gb=memory.total / (1024 ** 3),
-        cpu_usage_percent=psutil.cpu_percent(interval=1),
-        os=resolved_os,
-        os_version=resolved_version,
+        available_ram_gb=memory.available * _BYTES_TO_GIB,
+        total_ram_gb=memory.total * _BYTES_TO_GIB,
+        cpu_usage_percent=psutil.cpu_percent(interval=cpu_interval),
+        os=_OS,
+        os_version=_OS_VERSION,
     )
+    _system_info_cache = (time.monotonic(), info)
+    return info
+
+
+def get_system_info() -> SystemInfo:
+    """Gather key system information such as architecture, CPU cores, and RAM.
+
+    CPU usage is sampled without blocking, as the utilisation since the
+    previous sample; the first call shortly after start-up may report 0.0.
+    Results are reused for ``SYSTEM_INFO_TTL_SECONDS``.
+    """
+
+    now = time.monotonic()
+    if _system_info_cache is not None and now - _system_info_cache[0] < SYSTEM_INFO_TTL_SECONDS:
+        return _system_info_cache[1]
+    return _collect_system_info(None)
+
+
+def clear_system_info_cache() -> None:
+    """Forget the cached :class:`SystemInfo` so the next call samples fresh metrics."""
+
+    global _system_info_cache
+    _system_info_cache = None
+
+
+def get_system_info_blocking(cpu_interval: float = 1.0) -> SystemInfo:
+    """Like :func:`get_system_info`, but sample CPU usage over ``cpu_interval`` seconds."""
+
+    return _collect_system_info(cpu_interval)
 
 
 def calculate_max_browsers_or_tabs(browser: str = "chrome") -> BrowserCapacity:
@@ -89,45 +176,137 @@ def calculate_max_browsers_or_tabs(browser: str = "chrome") -> BrowserCapacity:
     )
 
 
+@lru_cache(maxsize=4)
 def get_browser_memory_usage(browser: str = "chrome") -> float:
-    """Estimate the average memory consumption per browser instance/tab."""
+    """Estimate the average memory consumption per browser instance/tab.
 
-    browser = browser.lower()
-    commands = {
-        "chrome": (["google-chrome", "--headless", "--disable-gpu"], "chrome"),
-        "firefox": (["firefox", "--headless"], "firefox"),
-    }
+    The measurement launches the browser, so results are memoised for the
+    process lifetime; call ``get_browser_memory_usage.cache_clear()`` to
+    force a new sample.
+    """
 
-    if browser not in commands:
+    browser = browser.lower()
+    if browser not in _BROWSER_COMMANDS:
         raise ValueError("Unsupported browser: Only 'chrome' and 'firefox' are supported.")
 
-    command, process_name = commands[browser]
+    command, process_name = _BROWSER_COMMANDS[browser]
     return _estimate_memory_usage(command, process_name)
 
 
-def _estimate_memory_usage(command: list[str], process_name: str) -> float:
+def _devnull() -> int:
+    """Return a shared ``/dev/null`` descriptor, opened on first use."""
+
+    global _devnull_fd
+    if _devnull_fd is None:
+        _devnull_fd = os.open(os.devnull, os.O_RDWR)
+        atexit.register(os.close, _devnull_fd)
+    return _devnull_fd
+
+
+def _estimate_memory_usage(command: Tuple[str, ...], process_name: str) -> float:
     """Launch a browser process to measure its memory usage."""
 
-    process: Optional[subprocess.Popen] = None
+    return asyncio.run(_estimate_memory_usage_async(command, process_name))
+
+
+async def get_all_browser_memory_usage() -> Dict[str, float]:
+    """Measure every supported browser concurrently, keyed by browser name."""
+
+    browsers = tuple(_BROWSER_COMMANDS)
+    results = await asyncio.gather(
+        *(_estimate_memory_usage_async(*_BROWSER_COMMANDS[browser]) for browser in browsers)
+    )
+    return dict(zip(browsers, results))
+
+
+async def _estimate_memory_usage_async(command: Tuple[str, ...], process_name: str) -> float:
     try:
-        process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        devnull = _devnull()
+        process = await asyncio.create_subprocess_exec(*command, stdout=devnull, stderr=devnull)
     except FileNotFoundError:
         return DEFAULT_MEMORY_USAGE_MB
 
     try:
-        time.sleep(5)
-        memory_usage = 0.0
-        for proc in psutil.process_iter(["pid", "name", "memory_info"]):
-            try:
-                if process_name in (proc.info.get("name") or "").lower():
-                    memory_usage += proc.info["memory_info"].rss / (1024 ** 2)
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
-        return memory_usage or DEFAULT_MEMORY_USAGE_MB
+        return await _wait_for_stable_rss(process_name, process) or DEFAULT_MEMORY_USAGE_MB
     finally:
-        if process:
+        if process.returncode is None:
             process.terminate()
-            process.wait(timeout=5)
+        try:
+            await asyncio.wait_for(process.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+
+
+async def _wait_for_stable_rss(process_name: str, process: asyncio.subprocess.Process) -> float:
+    """Poll the RSS of ``process_name`` until consecutive samples stop growing.
+
+    Sampling stops early once the launched ``process`` has exited or when no
+    matching process shows up within the first few samples.
+    """
+
+    previous, stable, current = 0.0, 0, 0.0
+    for sample in range(1, _RSS_POLL_MAX_SAMPLES + 1):
+        await asyncio.sleep(_RSS_POLL_INTERVAL_SECONDS)
+        current = _sum_rss(process_name)
+        if process.returncode is not None:
+            return current
+        if current == 0 and sample >= _RSS_EMPTY_SAMPLES:
+            return current
+        if abs(current - previous) / max(previous, 1.0) < _RSS_STABLE_RATIO:
+            stable += 1
+        else:
+            stable = 0
+        if stable >= _RSS_STABLE_SAMPLES and current > 0:
+            return current
+        previous = current
+    return current
+
+
+def _sum_rss(process_name: str) -> float:
+    """Return the combined RSS in MiB of processes whose name contains ``process_name``."""
+
+    if sys.platform.startswith("linux"):
+        return _sum_rss_procfs(process_name)
+
+    rss_bytes = 0
+    for pid in psutil.pids():
+        try:
+            proc = psutil.Process(pid)
+            with proc.oneshot():
+                if process_name in proc.name().lower():
+                    rss_bytes += proc.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return rss_bytes * _BYTES_TO_MIB
+
+
+def _read_proc_file(path: str) -> bytes:
+    # Raw descriptor reads skip the fstat/ioctl/lseek calls and the buffered
+    # text wrapper that open() sets up for every file.
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, 256)
+    finally:
+        os.close(fd)
+
+
+def _sum_rss_procfs(process_name: str) -> float:
+    """Linux fast path for :func:`_sum_rss` reading ``comm`` and ``statm`` from ``/proc``."""
+
+    needle = process_name.lower().encode()
+    rss_pages = 0
+    with os.scandir("/proc") as entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            try:
+                if needle not in _read_proc_file(f"/proc/{entry.name}/comm").lower():
+                    continue
+                rss_pages += int(_read_proc_file(f"/proc/{entry.name}/statm").split()[1])
+            except OSError:
+                continue
+    return rss_pages * _PAGE_SIZE * _BYTES_TO_MIB
 
 
 def transform_url(url: str) -> str:
@@ -135,19 +314,46 @@ def transform_url(url: str) -> str:
 
     if not url:
         raise ValueError("URL cannot be empty")
-    parsed = urllib.parse.urlparse(url)
-    domain = parsed.netloc or parsed.path
+    scheme_end = url.find("://")
+    if scheme_end != -1:
+        domain = url[scheme_end + 3 :]
+    else:
+        domain = url[2:] if url.startswith("//") else url
+    domain = domain.split("/", 1)[0].split("?", 1)[0].split("#", 1)[0]
     if not domain:
         raise ValueError("Invalid URL provided")
     return domain.replace(".", "_")
 
 
 def get_cached_url(url: str) -> str:
-    return f"https://webcache.googleusercontent.com/search?q=cache:{url}"
+    return _CACHE_PREFIX + url
+
+
+def _is_word_char(char: str) -> bool:
+    # Mirrors the regex \w class so the scanner honours \b-style boundaries.
+    return char.isalnum() or char == "_"
+
+
+def _is_snapshot_date(candidate: str) -> bool:
+    return (
+        all(candidate[offset] in _DIGITS for offset in _SNAPSHOT_DIGIT_OFFSETS)
+        and all(candidate[offset] == char for offset, char in _SNAPSHOT_SEPARATORS)
+        and candidate[3:6] in _MONTHS
+    )
 
 
 def get_snapshot_date(body_html: str) -> str:
-    match = re.search(r"\d{2} \w{3} \d{4} \d{2}:\d{2}:\d{2} GMT", body_html)
-    if not match:
-        raise ValueError("Snapshot date not found in HTML body")
-    return match.group(0)
+    """Return the first ``DD Mon YYYY HH:MM:SS GMT`` timestamp found in ``body_html``."""
+
+    index = body_html.find(" GMT", _SNAPSHOT_DATE_LENGTH)
+    while index != -1:
+        start = index - _SNAPSHOT_DATE_LENGTH
+        end = index + 4
+        if (
+            _is_snapshot_date(body_html[start:index])
+            and (start == 0 or not _is_word_char(body_html[start - 1]))
+            and (end == len(body_html) or not _is_word_char(body_html[end]))
+        ):
+            return body_html[start:end]
+        index = body_html.find(" GMT", index + 1)
+    raise ValueError("Snapshot date not found in HTML body")
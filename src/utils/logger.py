@@ -1,6 +1,8 @@
+import atexit
 import logging
+import queue
 import threading
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import sys
 from typing import Optional
 
@@ -45,7 +47,20 @@ class Logger:
         file_handler.setLevel(log_level)
         file_formatter = logging.Formatter(LOG_FORMAT)
         file_handler.setFormatter(file_formatter)
-        self.logger_instance.addHandler(file_handler)
+        self._file_handler = file_handler
+
+        # Route file writes through a queue so callers (e.g. the Tk thread) never
+        # block on disk I/O; a listener thread drains it into the file handler.
+        log_queue: queue.Queue = queue.Queue(-1)
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setLevel(log_level)
+        self.logger_instance.addHandler(queue_handler)
+        self._queue_handler = queue_handler
+        self._listener: Optional[QueueListener] = QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self.shutdown)
 
         # Create a stream handler for stdout
         stream_handler = logging.StreamHandler(sys.stdout)
@@ -58,18 +73,33 @@ class Logger:
         self.logger_instance.setLevel(log_level)
         for handler in self.logger_instance.handlers:
             handler.setLevel(log_level)
+        self._file_handler.setLevel(log_level)
+
+    def shutdown(self) -> None:
+        """Flush queued records to the log file and stop the writer thread.
+
+        Records logged afterwards (late worker threads, atexit hooks) are written
+        to the file directly instead of into a queue nobody drains.
+        """
+        if self._listener is not None:
+            # Attach the file handler before detaching the queue so no record
+            # logged concurrently misses the file.
+            self.logger_instance.addHandler(self._file_handler)
+            self.logger_instance.removeHandler(self._queue_handler)
+            self._listener.stop()
+            self._listener = None
 
-    def debug(self, message: str) -> None:
-        self.logger_instance.debug(message)
+    def debug(self, message: str, *args: object) -> None:
+        self.logger_instance.debug(message, *args)
     
-    def info(self, message: str) -> None:
-        self.logger_instance.info(message)
+    def info(self, message: str, *args: object) -> None:
+        self.logger_instance.info(message, *args)
     
-    def warning(self, message: str) -> None:
-        self.logger_instance.warning(message)
+    def warning(self, message: str, *args: object) -> None:
+        self.logger_instance.warning(message, *args)
     
-    def error(self, message: str) -> None:
-        self.logger_instance.error(message)
+    def error(self, message: str, *args: object) -> None:
+        self.logger_instance.error(message, *args)
 
-    def critical(self, message: str) -> None:
-        self.logger_instance.critical(message)
+    def critical(self, message: str, *args: object) -> None:
+        self.logger_instance.critical(message, *args)
@@ -1,10 +1,30 @@
 from __future__ import annotations
 
+import functools
 import json
 import os
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, ClassVar, Dict, Tuple
+
+try:  # Optional accelerated JSON codec; falls back to the standard library.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def _dumps(payload: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    # keep catching the standard library exception.
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 @dataclass
@@ -17,30 +37,58 @@ class LLMSettings:
 class SettingsStore:
     """Persist lightweight application settings to the user configuration directory."""
 
+    # Parsed settings per file, keyed by the (mtime_ns, size) they were read at.
+    _cache: ClassVar[Dict[Path, Tuple[Tuple[int, int], LLMSettings]]] = {}
+
     def __init__(self, config_path: Path | None = None) -> None:
         self.path = config_path or self._default_path()
 
     def load(self) -> LLMSettings:
-        if not self.path.exists():
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return LLMSettings()
+        except OSError:  # pragma: no cover - defensive guard
+            return LLMSettings()
+
+        fingerprint = (stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(self.path)
+        if cached is not None and cached[0] == fingerprint:
+            return replace(cached[1])
+
+        try:
+            # Fingerprint the descriptor that is actually read so a write racing
+            # the stat above cannot be cached under a stale key.
+            with open(self.path, "rb") as handle:
+                stat = os.fstat(handle.fileno())
+                raw = handle.read()
+        except FileNotFoundError:
+            return LLMSettings()
+        except OSError:  # pragma: no cover - defensive guard
             return LLMSettings()
 
         try:
-            data = json.loads(self.path.read_text())
-            return LLMSettings(
-                base_url=data.get("base_url", ""),
-                api_key=data.get("api_key", ""),
-                model=data.get("model", ""),
-            )
-        except (json.JSONDecodeError, OSError):  # pragma: no cover - defensive guard
+            data = _loads(raw)
+        except json.JSONDecodeError:
             return LLMSettings()
+        settings = LLMSettings(
+            base_url=data.get("base_url", ""),
+            api_key=data.get("api_key", ""),
+            model=data.get("model", ""),
+        )
+        self._cache[self.path] = ((stat.st_mtime_ns, stat.st_size), settings)
+        return replace(settings)
 
     def save(self, settings: LLMSettings) -> None:
         self.path.parent.mkdir(parents=True, exist_ok=True)
         payload: Dict[str, Any] = asdict(settings)
-        self.path.write_text(json.dumps(payload, indent=2))
+        self.path.write_bytes(_dumps(payload))
+        self._cache.pop(self.path, None)
 
     @staticmethod
+    @functools.cache
     def _default_path() -> Path:
+        # Resolved once per process; the home directory does not move under a running app.
         if os.name == "nt":
             base = Path(os.getenv("APPDATA", Path.home()))
             return base / "Copliot Enigma" / "settings.json"